@@ -1,6 +1,16 @@
+import csv
 import json
-from typing import List, Dict, Any, Literal, TypedDict
-from datetime import datetime
+import math
+import os
+import queue
+import shlex
+import sys
+import threading
+import time
+from typing import List, Dict, Any, Callable, DefaultDict, Iterable, Literal, Optional, Tuple, TypedDict, cast
+from collections import defaultdict
+
+import orjson
 
 # Import Rich components for nice console output
 from rich.console import Console
@@ -13,85 +23,569 @@ console = Console()
 
 TransactionType = Literal["income", "expense"]
 
-class Transaction(TypedDict):
+# Transaction types are interned on add and load, so comparing a stored type
+# against these constants is a pointer check rather than a string compare
+INCOME: TransactionType = cast(TransactionType, sys.intern("income"))
+EXPENSE: TransactionType = cast(TransactionType, sys.intern("expense"))
+
+class _DisplayFields(TypedDict, total=False):
+    """
+    Display strings cached when the transaction is added or loaded.
+    Fields starting with "_" are never written to disk.
+    """
+
+    _date_str: str
+    _type_tag: str
+    _category_display: str
+    _amount_str: str
+
+
+class Transaction(_DisplayFields):
     """
     Defines the strict structure for a single transaction record.
     We use dictionaries (TypedDict) for storing structured data.
     """
 
     id: int
-    date: str
+    date: int  # Unix timestamp in seconds
     type: TransactionType
     category: str
-    amount: float
+    # Stored in whole cents to keep sums exact. Older ledgers and exports
+    # used an `amount` field in dollars instead, converted on load/import.
+    amount_cents: int
     description: str
 
 
+# Fields every stored transaction has. Spelled out because TypedDict only
+# exposes __required_keys__ from Python 3.9 on.
+_REQUIRED_FIELDS = frozenset(
+    ("id", "date", "type", "category", "amount_cents", "description")
+)
+
+# Background write: (full journal snapshot or None, records to append, fsync?)
+WriteJob = Tuple[Optional[bytes], bytes, bool]
+
+# Format used to display dates (and used by older ledgers to store them)
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# less options that pass colour codes through to the terminal
+_RAW_CONTROL_FLAGS = ("--RAW-CONTROL-CHARS", "--raw-control-chars")
+# Short less options that take a value, e.g. -Pprompt or -j5. Anything
+# after one of these in a flag group like -FRX is its value, not a flag.
+_LESS_VALUE_OPTIONS = "bDhjkoOpPtTxyz#"
+
+
+def _is_raw_control_flag(flag: str) -> bool:
+    """True for -R, -r and their long forms, also inside a group like -FRX."""
+    if flag.startswith("--"):
+        return flag in _RAW_CONTROL_FLAGS
+    if not flag.startswith("-"):
+        return False
+    for letter in flag[1:]:
+        if letter in "Rr":
+            return True
+        if letter in _LESS_VALUE_OPTIONS:
+            return False
+    return False
+
+
+def _pager_shows_colour() -> bool:
+    """
+    Checks whether the pager Rich will use (pydoc's: $MANPAGER, $PAGER or
+    plain `less`) passes colour codes through instead of printing them raw.
+    """
+    pager = os.environ.get("MANPAGER") or os.environ.get("PAGER") or "less"
+    try:
+        command = shlex.split(pager)
+        less_flags = shlex.split(os.environ.get("LESS", ""))
+    except ValueError:
+        # Unbalanced quotes, so there's no telling what the pager does
+        return False
+    if not command:
+        return False
+    flags = command[1:]
+    if os.path.basename(command[0]) == "less":
+        # $LESS holds less's default options; the leading dash is optional
+        flags += [f if f.startswith("-") else "-" + f for f in less_flags]
+    return any(_is_raw_control_flag(f) for f in flags)
+
+
+# Amount colour and icon for each transaction type
+_TYPE_STYLE: Dict[str, Tuple[str, str]] = {
+    INCOME: ("green", "⬆️"),
+    EXPENSE: ("red", "⬇️"),
+}
+
+
+# Largest amount in cents a journal record can hold (orjson only writes
+# 64-bit integers)
+_MAX_CENTS = 2**63 - 1
+
+
+def _to_cents(amount: float) -> int:
+    """Converts a dollar amount to whole cents."""
+    return int(round(amount * 100))
+
+
+def _is_valid_amount(amount: float) -> bool:
+    """True for a positive, finite dollar amount whose cents fit in the journal."""
+    return math.isfinite(amount) and amount > 0 and amount * 100 <= _MAX_CENTS
+
+
+def _to_timestamp(date: str) -> int:
+    """Converts a local date string in DATE_FORMAT to a Unix timestamp."""
+    return int(time.mktime(time.strptime(date, DATE_FORMAT)))
+
+
+def _is_int(value: Any) -> bool:
+    """True for ints, excluding bools (which are ints in Python)."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _normalize_record(tx: Any, position: int) -> None:
+    """
+    Checks one loaded or imported record and converts legacy fields in place
+    (a dollar `amount`, a date string). Raises ValueError if it isn't valid.
+    """
+    if not isinstance(tx, dict):
+        raise ValueError(f"Transaction #{position} is not an object")
+    if "amount" in tx:
+        # Older ledgers stored dollars under "amount"
+        amount = tx.pop("amount")
+        if (
+            not (_is_int(amount) or isinstance(amount, float))
+            or not math.isfinite(amount)
+            or abs(amount) * 100 > _MAX_CENTS
+        ):
+            raise ValueError(f"Transaction #{position} has an invalid amount")
+        tx["amount_cents"] = _to_cents(amount)
+    if not _REQUIRED_FIELDS <= tx.keys():
+        raise ValueError(f"Transaction #{position} is missing required fields")
+    if isinstance(tx["date"], str):
+        # Older ledgers stored dates as formatted strings
+        tx["date"] = _to_timestamp(tx["date"])
+
+    if not _is_int(tx["id"]):
+        raise ValueError(f"Transaction #{position} has an invalid id")
+    if not _is_int(tx["date"]):
+        raise ValueError(f"Transaction #{position} has an invalid date")
+    if not _is_int(tx["amount_cents"]) or abs(tx["amount_cents"]) > _MAX_CENTS:
+        raise ValueError(f"Transaction #{position} has an invalid amount")
+    if tx["type"] not in (INCOME, EXPENSE):
+        raise ValueError(f"Transaction #{position} has an invalid type")
+    if not isinstance(tx["category"], str) or not isinstance(tx["description"], str):
+        raise ValueError(f"Transaction #{position} has an invalid category or description")
+    # Parsed strings aren't interned, so intern the type once here
+    tx["type"] = sys.intern(tx["type"])
+
+
+def _cache_display_fields(tx: Transaction) -> None:
+    """Pre-renders the table cells that don't change after a transaction is created."""
+    tx["_date_str"] = time.strftime(DATE_FORMAT, time.localtime(tx["date"]))
+    amount_style, type_icon = _TYPE_STYLE.get(tx["type"], _TYPE_STYLE[EXPENSE])
+    tx["_type_tag"] = f"[{amount_style}]{type_icon} {tx['type'].capitalize()}"
+    tx["_category_display"] = tx["category"].capitalize()
+    tx["_amount_str"] = f"[{amount_style}]${tx['amount_cents'] / 100:.2f}"
+
+
+def _persisted(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the record without its cached (underscore-prefixed) fields."""
+    return {k: v for k, v in record.items() if not k.startswith("_")}
+
+
+def _journal_line(record: Dict[str, Any]) -> bytes:
+    """Serializes one record, without its cached fields, as a journal line."""
+    return orjson.dumps(_persisted(record)) + b"\n"
+
+
+def _write_atomic(filename: str, data: bytes, durable: bool = False) -> None:
+    """
+    Writes `data` with a single write() to a temporary file, then renames it
+    over `filename`, so readers never see a half-written file.
+    """
+    tmp_file = filename + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, filename)
+    except OSError:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def _replay_journal(lines: Iterable[bytes]) -> Tuple[List[Transaction], int, bool]:
+    """
+    Replays JSON Lines journal records, parsing one line at a time.
+    Returns the live transactions, the number of records replayed and whether
+    an unparsable last line (a write torn by a crash) was skipped.
+    A bad record anywhere else raises ValueError.
+    """
+    live: Dict[int, Transaction] = {}
+    record_count = 0
+    bad_line: Optional[int] = None
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        if bad_line is not None:
+            raise ValueError(f"Journal line {bad_line} is corrupted")
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Only acceptable if it turns out to be the last line
+            bad_line = line_no
+            continue
+        if not isinstance(record, dict) or not _is_int(record.get("id")):
+            raise ValueError(f"Journal line {line_no} is not a transaction record")
+        record_count += 1
+        if record.get("op") == "delete":
+            live.pop(record["id"], None)
+        else:
+            live[record["id"]] = record
+    return list(live.values()), record_count, bad_line is not None
+
+
+def _read_legacy_file(filename: str) -> List[Transaction]:
+    """Reads an old single-document ledger (one JSON list of transactions)."""
+    with open(filename, "rb") as f:
+        data = orjson.loads(f.read())
+    if not isinstance(data, list):
+        raise ValueError("expected a list of transactions")
+    return data
+
+
+def _move_aside(filename: str) -> str:
+    """Renames a damaged file to an unused `.corrupt` name and returns that name."""
+    target = filename + ".corrupt"
+    n = 1
+    while os.path.exists(target):
+        target = f"{filename}.corrupt.{n}"
+        n += 1
+    os.replace(filename, target)
+    return target
+
+
 class PersonalFinanceLedger:
     """
     Manages all transactions and ledger operations.
     The main data structure is a list of Transaction dictionaries.
     """
 
-    def __init__(self, data_file: str = "ledger_data.json"):
+    # Journal records are buffered and written in batches of this size
+    SAVE_EVERY_OPS = 50
+
+    def __init__(self, data_file: str = "ledger_data.jsonl"):
         self.data_file = data_file
         self.transactions: List[Transaction] = []
+        # Number of records (adds and deletes) currently in the journal file
+        self._journal_length = 0
+        # Set when the journal on disk can't be appended to (e.g. it ends in
+        # a torn record) and has to be rewritten on the next flush
+        self._needs_rewrite = False
+        # Serialized journal records not yet written to disk
+        self._pending: List[bytes] = []
+        # All file writes happen on a background thread so the CLI doesn't
+        # wait for the disk. Each job is (full snapshot or None, records to
+        # append, fsync?); a job still waiting in the queue gets merged with
+        # the next one instead of being written separately.
+        self._save_queue: "queue.Queue[Optional[WriteJob]]" = queue.Queue(maxsize=1)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        # Last error hit by the writer thread, reported by flush(durable=True)
+        self._write_error: Optional[OSError] = None
+        self._closed = False
+        self._next_id = 1
+        # Running totals, kept up to date by add/delete
+        self._income_total = 0
+        self._expense_total = 0
+        # Maps transaction ID -> position in self.transactions
+        self._id_index: Dict[int, int] = {}
+        # Transaction IDs grouped by lowercased category / by type
+        self._by_category: DefaultDict[str, List[int]] = defaultdict(list)
+        self._by_type: DefaultDict[str, List[int]] = defaultdict(list)
         self._load_transactions()
-        self._next_id = max((t["id"] for t in self.transactions), default=0) + 1
 
     def _load_transactions(self) -> None:
-        """Loads transaction data from the JSON file."""
+        """Loads transaction data by replaying the JSON Lines journal."""
         try:
-            with open(self.data_file, "r") as f:
-                self.transactions = json.load(f)
+            with open(self.data_file, "rb") as f:
+                is_legacy = f.read(1) == b"["
+                f.seek(0)
+                if not is_legacy:
+                    transactions, self._journal_length, torn = _replay_journal(f)
+                    # A write cut off just before its newline leaves a record
+                    # the next append would run into
+                    unterminated = False
+                    if f.tell():
+                        f.seek(-1, os.SEEK_END)
+                        unterminated = f.read(1) != b"\n"
+                    self._replace_transactions(transactions)
+            if is_legacy:
+                # data_file still holds an old single-document ledger
+                self._migrate_legacy_file(self.data_file)
+                return
             console.print(
                 f"[green]Data loaded successfully from {self.data_file}.[/green]"
             )
+            if torn:
+                console.print(
+                    "[yellow]Ignored an incomplete last record (the previous session was interrupted while saving).[/yellow]"
+                )
+            # Rewrite the file from the records that did load before appending
+            self._needs_rewrite = torn or unterminated
         except FileNotFoundError:
-            self.transactions = []
-            console.print("[yellow]Starting with a fresh, empty ledger.[/yellow]")
-        except json.JSONDecodeError:
-            # For error/empty JSON files
+            legacy_file = os.path.splitext(self.data_file)[0] + ".json"
+            if legacy_file == self.data_file or not os.path.exists(legacy_file):
+                console.print("[yellow]Starting with a fresh, empty ledger.[/yellow]")
+                return
+            try:
+                self._migrate_legacy_file(legacy_file)
+            except (json.JSONDecodeError, orjson.JSONDecodeError, ValueError) as e:
+                # The legacy file is left untouched
+                console.print(
+                    f"[bold red]Error loading data: {legacy_file} is corrupted ({e}). Starting new ledger.[/bold red]"
+                )
+        except (json.JSONDecodeError, orjson.JSONDecodeError, ValueError) as e:
+            # Keep the damaged file for recovery instead of overwriting it
+            corrupt_file = _move_aside(self.data_file)
             console.print(
-                "[bold red]Error loading data: JSON file is corrupted or empty. Starting new ledger.[/bold red]"
+                f"[bold red]Error loading data: {e}. The file was moved to {corrupt_file}. Starting new ledger.[/bold red]"
             )
-            self.transactions = []
+            self._journal_length = 0
+
+    def _migrate_legacy_file(self, legacy_file: str) -> None:
+        """
+        One-shot migration from the old single-document JSON ledger to the
+        journal. Parse and conversion errors are left to the caller.
+        """
+        # Convert legacy amounts and dates first, so the journal is written
+        # in the current format
+        self._replace_transactions(_read_legacy_file(legacy_file))
+        self._save_transactions()
+        console.print(
+            f"[green]Migrated {legacy_file} from the old format. The ledger is now saved to {self.data_file}.[/green]"
+        )
 
-    def _save_transactions(self) -> None:
-        """ Saves current transactions to JSON file. """
+    def _save_transactions(self, durable: bool = False) -> None:
+        """ Rewrites the journal with one line per current transaction. """
+        # Compact output: this file is not meant to be hand-edited
+        # (use export for that)
+        snapshot = b"".join(_journal_line(t) for t in self.transactions)
+        self._journal_length = len(self.transactions)
+        self._needs_rewrite = False
+        # The rewrite already covers any buffered records
+        self._pending.clear()
+        self._submit_write(snapshot, b"", durable)
+
+    def _append_to_journal(self, line: bytes) -> None:
+        """Queues one serialized add or delete record for the journal file."""
+        self._pending.append(line)
+        if len(self._pending) >= self.SAVE_EVERY_OPS:
+            self.flush()
+
+    def flush(self, durable: bool = False) -> None:
+        """
+        Writes buffered journal records to disk.
+        With durable=True this waits until everything is fsync'ed. If the
+        background writer failed, the whole journal is rewritten once more
+        and the OSError is raised if that fails too.
+        """
+        self._ensure_open()
+        if self._needs_rewrite:
+            # Also covers an earlier write that failed
+            self._save_transactions(durable)
+        elif self._pending:
+            # Replaying deleted records gets wasteful, so rewrite once the
+            # journal would hold more than twice the live transactions
+            journal_length = self._journal_length + len(self._pending)
+            if journal_length > 2 * len(self.transactions):
+                self._save_transactions(durable)
+            else:
+                self._submit_write(None, b"".join(self._pending), durable)
+                self._journal_length = journal_length
+                self._pending.clear()
+
+        if not durable:
+            return
+        # Wait until the background writer has finished everything
+        self._save_queue.join()
+        if self._write_error is not None:
+            # Some earlier write may be missing from the file, so retry with
+            # a full rewrite from memory
+            self._write_error = None
+            self._save_transactions(durable=True)
+            self._save_queue.join()
+            if self._write_error is not None:
+                error, self._write_error = self._write_error, None
+                raise error
+
+    def compact(self) -> None:
+        """Rewrites the journal so it only holds the live transactions."""
+        self._ensure_open()
+        self._save_transactions()
+
+    def close(self) -> None:
+        """
+        Saves all changes to disk and stops the background writer.
+        Raises OSError if the data could not be saved; the ledger is closed either way.
+        """
+        if self._closed:
+            return
         try:
-            with open(self.data_file, "w") as f:
-                # Use indent=4 to make the exported file human-readable
-                json.dump(self.transactions, f, indent=4)
-        except IOError:
-            console.print("[bold red]Error: Could not save data to file![/bold red]")
+            self.flush(durable=True)
+        finally:
+            self._closed = True
+            self._save_queue.put(None)
+            self._writer.join()
+
+    def _ensure_open(self) -> None:
+        """Raises RuntimeError once close() has been called."""
+        if self._closed:
+            raise RuntimeError("The ledger has been closed.")
+
+    def _submit_write(self, snapshot: Optional[bytes], tail: bytes, durable: bool) -> None:
+        """Queues a write for the background writer, merging it with a waiting one."""
+        self._ensure_open()
+        try:
+            waiting = self._save_queue.get_nowait()
+            self._save_queue.task_done()
+        except queue.Empty:
+            waiting = None
+        if waiting is not None and snapshot is None:
+            # A new snapshot replaces whatever was waiting, but appended
+            # records have to go out after the waiting write
+            snapshot = waiting[0]
+            tail = waiting[1] + tail
+            durable = durable or waiting[2]
+        self._save_queue.put((snapshot, tail, durable))
+
+    def _writer_loop(self) -> None:
+        """Runs on the writer thread and performs all writes to the data file."""
+        while True:
+            job = self._save_queue.get()
+            try:
+                if job is None:
+                    return
+                snapshot, tail, durable = job
+                if snapshot is not None:
+                    _write_atomic(self.data_file, snapshot, durable and not tail)
+                if tail:
+                    with open(self.data_file, "ab") as f:
+                        f.write(tail)
+                        if durable:
+                            f.flush()
+                            os.fsync(f.fileno())
+            except IOError as e:
+                console.print("[bold red]Error: Could not save data to file![/bold red]")
+                # The file may now be missing records; rewrite it next time
+                self._needs_rewrite = True
+                self._write_error = e
+            finally:
+                self._save_queue.task_done()
 
     def add_transaction(
-        self, tx_type: TransactionType, category: str, amount: float, description: str
+        self,
+        tx_type: TransactionType,
+        category: str,
+        amount: float,
+        description: str,
+        quiet: bool = False,
     ) -> None:
         """Adds new transaction dictionary to the list."""
+        self._ensure_open()
         new_transaction: Transaction = {
             "id": self._next_id,
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "type": tx_type,
+            "date": int(time.time()),
+            "type": cast(TransactionType, sys.intern(tx_type)),
             "category": category,
-            "amount": round(amount, 2),
+            "amount_cents": _to_cents(amount),
             "description": description,
         }
+        _cache_display_fields(new_transaction)
+        # Serialize first, so a record that can't be written (e.g. an amount
+        # beyond 64 bits) leaves the ledger unchanged
+        line = _journal_line(new_transaction)
         self.transactions.append(new_transaction)
+        self._id_index[new_transaction["id"]] = len(self.transactions) - 1
+        self._by_category[category.lower()].append(new_transaction["id"])
+        self._by_type[new_transaction["type"]].append(new_transaction["id"])
         self._next_id += 1
-        self._save_transactions()
+        if new_transaction["type"] == INCOME:
+            self._income_total += new_transaction["amount_cents"]
+        elif new_transaction["type"] == EXPENSE:
+            self._expense_total += new_transaction["amount_cents"]
+        self._append_to_journal(line)
+        if not quiet:
+            console.print(
+                f"\n[bold green]✅ {tx_type.capitalize()} transaction added! ID: {new_transaction['id']}[/bold green]\n"
+            )
+
+    def bulk_add(self, filename: str) -> None:
+        """
+        Adds every row of a CSV file with the columns
+        type, category, amount, description (an optional header row is skipped).
+        Invalid rows are skipped and reported. Rows are written out in the
+        usual SAVE_EVERY_OPS batches and whatever is left is flushed at the end.
+        """
+        self._ensure_open()
+        added = 0
+        skipped: List[int] = []
+        try:
+            with open(filename, newline="") as f:
+                for line_no, row in enumerate(csv.reader(f), start=1):
+                    if not row or (line_no == 1 and row[0].strip().lower() == "type"):
+                        continue
+                    try:
+                        tx_type, category, amount_text, description = row
+                        tx_type = tx_type.strip().lower()
+                        amount = float(amount_text)
+                    except ValueError:
+                        skipped.append(line_no)
+                        continue
+                    if tx_type not in (INCOME, EXPENSE) or not _is_valid_amount(amount):
+                        skipped.append(line_no)
+                        continue
+                    self.add_transaction(
+                        cast(TransactionType, tx_type),
+                        category.strip(),
+                        amount,
+                        description.strip(),
+                        quiet=True,
+                    )
+                    added += 1
+        except FileNotFoundError:
+            console.print(f"[bold red]Error: File not found at {filename}.[/bold red]")
+            return
+        finally:
+            self.flush()
+
         console.print(
-            f"\n[bold green]✅ {tx_type.capitalize()} transaction added! ID: {new_transaction['id']}[/bold green]\n"
+            f"\n[bold green]✅ {added} transactions added from {filename}.[/bold green]"
         )
+        if skipped:
+            console.print(
+                f"[bold yellow]Skipped invalid rows: {', '.join(map(str, skipped))}[/bold yellow]"
+            )
 
     def delete_transaction(self, tx_id: int) -> bool:
         """ Deletes a transaction by its ID. """
-        initial_count = len(self.transactions)
-        self.transactions = [t for t in self.transactions if t["id"] != tx_id]
-
-        if len(self.transactions) < initial_count:
-            self._save_transactions()
+        self._ensure_open()
+        idx = self._id_index.pop(tx_id, None)
+
+        if idx is not None:
+            removed = self.transactions.pop(idx)
+            # Only the transactions after the removed one have shifted
+            self._rebuild_id_index(start=idx)
+            self._by_category[removed["category"].lower()].remove(tx_id)
+            self._by_type[removed["type"]].remove(tx_id)
+            if removed["type"] == INCOME:
+                self._income_total -= removed["amount_cents"]
+            elif removed["type"] == EXPENSE:
+                self._expense_total -= removed["amount_cents"]
+            self._append_to_journal(_journal_line({"id": tx_id, "op": "delete"}))
             console.print(
                 f"\n[bold yellow]🗑️ Transaction ID {tx_id} deleted.[/bold yellow]\n"
             )
@@ -102,34 +596,87 @@ class PersonalFinanceLedger:
             )
             return False
 
+    def _sum_by_type(self) -> Tuple[int, int]:
+        """Sums income and expense amounts in one pass over all transactions."""
+        totals: DefaultDict[str, int] = defaultdict(int)
+        for tx in self.transactions:
+            totals[tx["type"]] += tx["amount_cents"]
+        return totals[INCOME], totals[EXPENSE]
+
+    def _rebuild_id_index(self, start: int = 0) -> None:
+        """Refreshes the ID -> position index from position `start` onwards."""
+        for i in range(start, len(self.transactions)):
+            self._id_index[self.transactions[i]["id"]] = i
+
+    def _replace_transactions(self, transactions: List[Transaction]) -> None:
+        """
+        Installs a new transaction list, validating every record and rebuilding
+        the next ID, running totals and lookup indexes in a single pass.
+        A ValueError leaves the current ledger untouched.
+        """
+        id_index: Dict[int, int] = {}
+        by_category: DefaultDict[str, List[int]] = defaultdict(list)
+        by_type: DefaultDict[str, List[int]] = defaultdict(list)
+        totals: DefaultDict[str, int] = defaultdict(int)
+        max_id = 0
+        for i, tx in enumerate(transactions):
+            _normalize_record(tx, i + 1)
+            if tx["id"] in id_index:
+                raise ValueError(f"Transaction #{i + 1} repeats ID {tx['id']}")
+            try:
+                _cache_display_fields(tx)
+            except (OverflowError, OSError, ValueError):
+                # time.localtime() rejects timestamps far outside its range
+                raise ValueError(f"Transaction #{i + 1} has an invalid date") from None
+            id_index[tx["id"]] = i
+            by_category[tx["category"].lower()].append(tx["id"])
+            by_type[tx["type"]].append(tx["id"])
+            totals[tx["type"]] += tx["amount_cents"]
+            max_id = max(max_id, tx["id"])
+
+        self.transactions = transactions
+        self._next_id = max_id + 1
+        self._id_index = id_index
+        self._by_category = by_category
+        self._by_type = by_type
+        self._income_total = totals[INCOME]
+        self._expense_total = totals[EXPENSE]
+
+    def transactions_by_category(self, category: str) -> List[Transaction]:
+        """Returns the transactions in a category (case-insensitive)."""
+        ids = self._by_category.get(category.lower(), [])
+        return [self.transactions[self._id_index[i]] for i in ids]
+
+    def transactions_by_type(self, tx_type: str) -> List[Transaction]:
+        """Returns the income or expense transactions."""
+        ids = self._by_type.get(tx_type, [])
+        return [self.transactions[self._id_index[i]] for i in ids]
+
+    def compute_stats(self) -> Tuple[float, float, float]:
+        """Returns total income, total expense and balance in dollars from the running totals."""
+        income, expense = self._income_total, self._expense_total
+        if sys.flags.dev_mode:
+            # Only pay for the full recount when running with `python -X dev`
+            assert (income, expense) == self._sum_by_type()
+        return income / 100, expense / 100, (income - expense) / 100
+
     def calculate_balance(self) -> float:
         """Calculates the current net balance."""
-        balance = 0.0
-        for tx in self.transactions:
-            if tx["type"] == "income":
-                balance += tx["amount"]
-            elif tx["type"] == "expense":
-                balance -= tx["amount"]
-        return round(balance, 2)
+        return self.compute_stats()[2]
 
     def generate_summary(self) -> Dict[str, float]:
         """Calculates total income and total expense."""
-        summary: Dict[str, float] = {"income": 0.0, "expense": 0.0}
-        for tx in self.transactions:
-            if tx["type"] == "income":
-                summary["income"] += tx["amount"]
-            elif tx["type"] == "expense":
-                summary["expense"] += tx["amount"]
-
-        summary["income"] = round(summary["income"], 2)
-        summary["expense"] = round(summary["expense"], 2)
-        return summary
+        income, expense, _ = self.compute_stats()
+        return {INCOME: income, EXPENSE: expense}
 
     def export_data(self, filename: str) -> None:
         """Exports all data to a user-named JSON file"""
         try:
-            with open(filename, "w") as f:
-                json.dump(self.transactions, f, indent=4)
+            data = orjson.dumps(
+                [_persisted(t) for t in self.transactions],
+                option=orjson.OPT_INDENT_2,
+            )
+            _write_atomic(filename, data)
             console.print(
                 f"[bold cyan]📤 Data successfully exported to {filename}[/bold cyan]"
             )
@@ -139,25 +686,33 @@ class PersonalFinanceLedger:
             )
 
     def import_data(self, filename: str) -> None:
-        """Imports data from a JSON file, replacing the current ledger."""
+        """
+        Imports data from a JSON file, replacing the current ledger.
+        JSON Lines files (.jsonl, like the ledger's own journal) are read one
+        record at a time instead of being parsed as a single document.
+        """
+        self._ensure_open()
+        imported_data: List[Transaction]
         try:
-            with open(filename, "r") as f:
-                imported_data: List[Transaction] = json.load(f)
-            # Simple validation to check if the imported data looks like transactions
-            if not isinstance(imported_data, list) or not all(
-                isinstance(d, dict) for d in imported_data
-            ):
+            with open(filename, "rb") as f:
+                if filename.endswith(".jsonl"):
+                    imported_data, _, torn = _replay_journal(f)
+                    if torn:
+                        raise ValueError("The last line of the file is incomplete")
+                else:
+                    imported_data = orjson.loads(f.read())
+            if not isinstance(imported_data, list):
                 raise ValueError("Imported file format is incorrect.")
 
-            self.transactions = imported_data
-            self._next_id = max((t["id"] for t in self.transactions), default=0) + 1
+            # Each record is validated in the same pass that indexes it
+            self._replace_transactions(imported_data)
             self._save_transactions()
             console.print(
                 f"[bold green]📥 Data successfully imported from {filename}.[/bold green]"
             )
         except FileNotFoundError:
             console.print(f"[bold red]Error: File not found at {filename}.[/bold red]")
-        except (json.JSONDecodeError, ValueError) as e:
+        except (json.JSONDecodeError, orjson.JSONDecodeError, ValueError) as e:
             console.print(
                 f"[bold red]Error importing data: {e}. File format may be invalid.[/bold red]"
             )
@@ -182,26 +737,29 @@ def display_transactions(
 
     # Add rows
     for tx in transactions:
-        amount_style = "green" if tx["type"] == "income" else "red"
-        type_icon = "⬆️" if tx["type"] == "income" else "⬇️"
-
         table.add_row(
             str(tx["id"]),
-            tx["date"],
-            f"[{amount_style}]{type_icon} {tx['type'].capitalize()}",
-            tx["category"].capitalize(),
-            f"[{amount_style}]${tx['amount']:.2f}",
+            tx["_date_str"],
+            tx["_type_tag"],
+            tx["_category_display"],
+            tx["_amount_str"],
             tx["description"],
         )
-    console.print(table)
+
+    # Page long histories instead of scrolling them past the user
+    if console.is_terminal and len(transactions) > console.height:
+        with console.pager(styles=_pager_shows_colour()):
+            console.print(table)
+    else:
+        console.print(table)
 
 
 def handle_add(ledger: PersonalFinanceLedger) -> None:
     """Prompts user for input to add a new transaction."""
     tx_type: str = Prompt.ask(
         "Is this [bold blue]Income[/bold blue] or [bold blue]Expense[/bold blue]?",
-        choices=["income", "expense"],
-        default="expense",
+        choices=[INCOME, EXPENSE],
+        default=EXPENSE,
     )
     category = Prompt.ask(
         "Enter Category (e.g., [green]Salary[/green], [red]Groceries[/red])"
@@ -210,9 +768,9 @@ def handle_add(ledger: PersonalFinanceLedger) -> None:
     amount = FloatPrompt.ask("Enter Amount", default=0.0)
     description = Prompt.ask("Enter a brief description")
 
-    if amount <= 0:
+    if not _is_valid_amount(amount):
         console.print(
-            "[bold red]Amount must be greater than zero. Transaction cancelled.[/bold red]"
+            "[bold red]Amount must be a positive number within the ledger's range. Transaction cancelled.[/bold red]"
         )
         return
 
@@ -228,14 +786,12 @@ def handle_view(ledger: PersonalFinanceLedger) -> None:
 
     if filter_choice.lower() == "all":
         display_transactions(ledger.transactions, "Full Transaction History")
-    elif filter_choice.lower() in ("income", "expense"):
-        filtered = [
-            t for t in ledger.transactions if t["type"] == filter_choice.lower()
-        ]
+    elif filter_choice.lower() in (INCOME, EXPENSE):
+        filtered = ledger.transactions_by_type(filter_choice.lower())
         display_transactions(filtered, f"{filter_choice.capitalize()} Transactions")
     elif filter_choice.lower() == "category":
         cat = Prompt.ask("Enter Category to filter by").lower()
-        filtered = [t for t in ledger.transactions if t["category"].lower() == cat]
+        filtered = ledger.transactions_by_category(cat)
         display_transactions(filtered, f"Transactions in Category: {cat.capitalize()}")
     else:
         console.print("[bold red]Invalid filter choice.[/bold red]")
@@ -243,17 +799,16 @@ def handle_view(ledger: PersonalFinanceLedger) -> None:
 
 def handle_summary(ledger: PersonalFinanceLedger) -> None:
     """Displays the financial summary."""
-    summary = ledger.generate_summary()
-    balance = ledger.calculate_balance()
+    income, expense, balance = ledger.compute_stats()
 
     table = Table(title="Financial Summary", show_header=False)
     table.add_column("Metric", style="bold")
     table.add_column("Value", justify="right")
 
     table.add_row(
-        "[green]Total Income[/green]", f"[green]${summary['income']:.2f}[/green]"
+        "[green]Total Income[/green]", f"[green]${income:.2f}[/green]"
     )
-    table.add_row("[red]Total Expense[/red]", f"[red]${summary['expense']:.2f}[/red]")
+    table.add_row("[red]Total Expense[/red]", f"[red]${expense:.2f}[/red]")
 
     balance_style = "bold green" if balance >= 0 else "bold red"
     table.add_row(
@@ -297,6 +852,22 @@ def handle_import(ledger: PersonalFinanceLedger) -> None:
     ledger.import_data(filename)
 
 
+def handle_save(ledger: PersonalFinanceLedger) -> None:
+    """Writes unsaved changes to disk"""
+    try:
+        ledger.flush(durable=True)
+    except OSError as e:
+        console.print(f"[bold red]Error: Could not save data to file: {e}[/bold red]")
+        return
+    console.print("[bold green]💾 All changes saved.[/bold green]")
+
+
+def handle_bulk_add(ledger: PersonalFinanceLedger) -> None:
+    """Adds transactions from a CSV file"""
+    filename = Prompt.ask("Enter the CSV filename to add transactions from")
+    ledger.bulk_add(filename)
+
+
 def run_cli() -> None:
     """The main entry point for the Command Line Interface."""
     console.print(
@@ -320,38 +891,63 @@ def run_cli() -> None:
         "export": handle_export,
         "import": handle_import,
         "delete": handle_delete,
+        "save": handle_save,
+        "bulk_add": handle_bulk_add,
     }
 
     def display_help() -> None:
         """Displays all available commands."""
         console.print("\n[bold magenta]Available Commands:[/bold magenta]")
         for cmd in commands:
-            console.print(f"  [cyan]{cmd:<7}[/cyan]: {commands[cmd].__doc__.strip()}")
-        console.print("  [cyan]help[/cyan]   : Show this help message")
+            console.print(f"  [cyan]{cmd:<8}[/cyan]: {commands[cmd].__doc__.strip()}")
+        console.print("  [cyan]help[/cyan]    : Show this help message")
         console.print("  [cyan]exit/quit[/cyan]: Exit the program\n")
 
     display_help()  # Show help at startup
 
-    while True:
-        user_input: str = (
-            Prompt.ask("[bold green]Ledger[/bold green] >").lower().strip()
-        )
+    # Every input is resolved with one lookup. Actions return True to leave
+    # the loop.
+    dispatch: Dict[str, Callable[[PersonalFinanceLedger], Any]] = {
+        **commands,
+        "help": lambda _: display_help(),
+        "exit": lambda _: True,
+        "quit": lambda _: True,
+    }
+
+    try:
+        while True:
+            user_input: str = (
+                Prompt.ask("[bold green]Ledger[/bold green] >").lower().strip()
+            )
 
-        if user_input in ("exit", "quit"):
-            console.print(Panel("[bold yellow]👋 Goodbye! Data saved.[/bold yellow]"))
-            break
-        elif user_input == "help":
-            display_help()
-        elif user_input in commands:
+            action = dispatch.get(user_input)
+            if action is None:
+                console.print(
+                    f"[bold red]Unknown command: '{user_input}'. Type 'help' for a list of commands.[/bold red]"
+                )
+                continue
             try:
                 # Call the corresponding function from the dictionary
-                commands[user_input](ledger)
+                if action(ledger):
+                    break
             except Exception as e:
                 console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
-        else:
-            console.print(
-                f"[bold red]Unknown command: '{user_input}'. Type 'help' for a list of commands.[/bold red]"
-            )
+    finally:
+        # Changes are written in batches and in the background, so save the
+        # rest on the way out (this also covers Ctrl+C)
+        try:
+            ledger.close()
+            saved = True
+        except OSError as e:
+            console.print(f"[bold red]Error: Could not save data to file: {e}[/bold red]")
+            saved = False
+
+    if saved:
+        console.print(Panel("[bold yellow]👋 Goodbye! Data saved.[/bold yellow]"))
+    else:
+        console.print(
+            Panel("[bold red]👋 Goodbye! Your latest changes could NOT be saved.[/bold red]")
+        )
 
 
 if __name__ == "__main__":